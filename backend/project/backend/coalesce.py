@@ -0,0 +1,39 @@
+import asyncio
+from typing import Callable, Dict, Hashable, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+
+class SingleFlight:
+    """Share one in-flight threadpool call between concurrent callers with the same key.
+
+    Keys are dropped as soon as the call finishes, so results are never cached.
+    Must be used from a single event loop (one per worker process).
+    """
+
+    def __init__(self, on_complete: Optional[Callable[[int], None]] = None):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._callers: Dict[Hashable, int] = {}
+        self._on_complete = on_complete
+
+    async def run(self, key: Hashable, fn: Callable, *args):
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(run_in_threadpool(fn, *args))
+            self._inflight[key] = task
+            self._callers[key] = 0
+            task.add_done_callback(lambda t, key=key: self._finish(key, t))
+        self._callers[key] += 1
+        # shield: a disconnecting caller must not cancel the computation others are waiting on
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future):
+        self._inflight.pop(key, None)
+        fanout = self._callers.pop(key, 0)
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every caller went away
+        if self._on_complete is not None:
+            self._on_complete(fanout)
+
+    def __len__(self):
+        return len(self._inflight)
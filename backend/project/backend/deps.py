@@ -4,8 +4,9 @@ from pathlib import Path
 from typing import Optional, Tuple
 import joblib, torch
 from pydantic_settings import BaseSettings
+from starlette.concurrency import run_in_threadpool
 
-from project.backend.model_def import ProjectileNet
+from project.backend.model_def import ProjectileNet, hidden_sizes_from_state_dict
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
@@ -43,9 +44,15 @@ def get_artifacts() -> Tuple[torch.nn.Module, object, object, torch.device]:
     sx = joblib.load(s.scaler_x_path)
     sy = joblib.load(s.scaler_y_path)
 
-    model = ProjectileNet()
     state = torch.load(s.model_path, map_location=device)
+    model = ProjectileNet(hidden_sizes_from_state_dict(state))  # teacher or distilled student
     model.load_state_dict(state)
     model.to(device).eval()
     _ = model(torch.zeros(1, 2, device=device))  # warmup
     return model, sx, sy, device
+
+async def get_loaded_artifacts() -> Tuple[torch.nn.Module, object, object, torch.device]:
+    # Once cached, hand the artifacts back on the event loop; only the first load needs a thread.
+    if get_artifacts.cache_info().currsize:
+        return get_artifacts()
+    return await run_in_threadpool(get_artifacts)
@@ -1,9 +1,10 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from prometheus_client import CollectorRegistry, Counter, Histogram, CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from starlette.responses import Response
 from time import perf_counter
 from project.backend.routers import predict, health
+from project.backend.metrics import reg, REQS, LAT
 
 app = FastAPI(title="Physics Service", version="1.0.0")
 
@@ -14,10 +15,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-reg = CollectorRegistry()
-REQS = Counter("http_requests_total", "Count of requests", ["route","method","code"], registry=reg)
-LAT  = Histogram("http_request_duration_seconds", "Request latency", ["route","method"], registry=reg)
-
 @app.middleware("http")
 async def metrics_mw(request: Request, call_next):
     start = perf_counter()
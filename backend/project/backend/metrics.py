@@ -0,0 +1,13 @@
+from prometheus_client import CollectorRegistry, Counter, Histogram
+
+reg = CollectorRegistry()
+REQS = Counter("http_requests_total", "Count of requests", ["route","method","code"], registry=reg)
+LAT  = Histogram("http_request_duration_seconds", "Request latency", ["route","method"], registry=reg)
+
+PREDICT_FANOUT = Histogram(
+    "predict_singleflight_fanout", "Requests served by one coalesced forward pass",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128), registry=reg,
+)
+PREDICT_COALESCED = Counter(
+    "predict_coalesced_total", "Predict requests that joined an identical in-flight computation", registry=reg,
+)
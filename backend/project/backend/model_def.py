@@ -1,16 +1,27 @@
 
+from typing import Sequence, Tuple
 import torch.nn as nn
 
+DEFAULT_HIDDEN_SIZES = (64, 32)
+
 class ProjectileNet(nn.Module):
-    def __init__(self):
+    def __init__(self, hidden_sizes: Sequence[int] = DEFAULT_HIDDEN_SIZES):
         super().__init__()
-        self.net = nn.Sequential(
-            nn.Linear(2, 64),
-            nn.ReLU(),
-            nn.Linear(64, 32),
-            nn.ReLU(),
-            nn.Linear(32, 3),
-        )
+        self.hidden_sizes = tuple(int(w) for w in hidden_sizes)
+        layers = []
+        in_features = 2
+        for width in self.hidden_sizes:
+            layers += [nn.Linear(in_features, width), nn.ReLU()]
+            in_features = width
+        layers.append(nn.Linear(in_features, 3))
+        self.net = nn.Sequential(*layers)
 
     def forward(self, x):
-        return self.net(x)
\ No newline at end of file
+        return self.net(x)
+
+
+def hidden_sizes_from_state_dict(state) -> Tuple[int, ...]:
+    # Linear weights are stored as (out, in); every layer but the last is hidden.
+    keys = [k for k in state if k.startswith("net.") and k.endswith(".weight")]
+    keys.sort(key=lambda k: int(k.split(".")[1]))
+    return tuple(int(state[k].shape[0]) for k in keys[:-1])
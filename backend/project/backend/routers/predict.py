@@ -2,17 +2,34 @@ from fastapi import APIRouter, Depends, HTTPException
 import numpy as np
 
 from project.backend.schemas import PredictRequest, PredictResponse, Prediction
-from project.backend.deps import get_artifacts
+from project.backend.deps import get_loaded_artifacts
 from project.backend.predict_utils import predict
+from project.backend.coalesce import SingleFlight
+from project.backend.metrics import PREDICT_FANOUT, PREDICT_COALESCED
 
 router = APIRouter()
 
+
+def _record_fanout(fanout: int):
+    PREDICT_FANOUT.observe(fanout)
+    PREDICT_COALESCED.inc(max(0, fanout - 1))
+
+
+_flight = SingleFlight(on_complete=_record_fanout)
+
+
+def _normalize(velocity: float, angle_deg: float):
+    # The model sees float32, so inputs equal after the cast give identical predictions.
+    return tuple(float(np.float32(v)) + 0.0 for v in (velocity, angle_deg))
+
+
 @router.post("/predict", response_model=PredictResponse)
-def predict_endpoint(req: PredictRequest, artifacts = Depends(get_artifacts)):
+async def predict_endpoint(req: PredictRequest, artifacts = Depends(get_loaded_artifacts)):
     model, sx, sy, device = artifacts
-    X = np.array([[req.velocity, req.angle_deg]], dtype=np.float32)
+    key = _normalize(req.velocity, req.angle_deg)
+    X = np.array([key], dtype=np.float32)
     try:
-        y = predict(model, X, sx, sy, device)
+        y = await _flight.run(key, predict, model, X, sx, sy, device)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Inference failed: {e}")
     r, h, t = map(float, y[0])
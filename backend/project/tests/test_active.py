@@ -0,0 +1,75 @@
+import os
+import json
+import tempfile
+import numpy as np
+from training.active import ActiveConfig, domain_edges, drop_seen, select_samples, targets, main
+from training.data import projectile_targets
+
+
+def test_domain_edges_on_boundary():
+    cfg = ActiveConfig()
+    X = domain_edges(cfg, n_per_side=10)
+
+    assert X.shape == (40, 2)
+    on_v = np.isin(X[:, 0], cfg.v_range)
+    on_a = np.isin(X[:, 1], cfg.a_range)
+    assert (on_v | on_a).all()
+
+
+def test_targets_match_analytic():
+    X = np.array([[50.0, 45.0], [0.0, 30.0], [100.0, 0.0]], dtype=np.float32)
+    r, h, t = projectile_targets(X[:, 0].astype(np.float64), X[:, 1].astype(np.float64))
+
+    assert np.allclose(targets(X), np.stack([r, h, t], axis=1), atol=1e-3)
+    assert np.allclose(targets(X)[1:], [[0, 0, 0], [0, 0, 0]], atol=1e-3)
+
+
+def test_select_samples_prefers_worst():
+    rng = np.random.default_rng(0)
+    errors = np.arange(100, dtype=float)
+    idx = select_samples(rng, errors, n_add=10, explore_frac=0.2)
+
+    assert len(idx) == len(set(idx)) == 10
+    assert set(range(92, 100)) <= set(idx)
+
+
+def test_active_main_writes_artifacts():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = {k: os.path.join(tmpdir, os.path.basename(getattr(ActiveConfig, k))) for k in
+                 ["model_path", "scaler_x_path", "scaler_y_path", "active_data_path", "active_metrics_path"]}
+        cfg = ActiveConfig(initial_n=64, val_n=64, eval_n=256, pool_n=256, add_per_round=32,
+                           max_rounds=2, round_epochs=2, round_patience=2, target_max_error=0.0, **paths)
+        meta = main(cfg)
+
+        assert [r["n_samples"] for r in meta["rounds"]] == [64, 96]
+        assert not meta["target_reached"]
+        for p in paths.values():
+            assert os.path.exists(p)
+        with open(cfg.active_metrics_path) as f:
+            assert len(json.load(f)["rounds"]) == 2
+
+
+def test_select_samples_clamps_to_pool_size():
+    rng = np.random.default_rng(0)
+    errors = np.arange(5, dtype=float)
+
+    assert sorted(select_samples(rng, errors, n_add=50, explore_frac=0.2)) == [0, 1, 2, 3, 4]
+    assert sorted(select_samples(rng, errors, n_add=5, explore_frac=0.0)) == [0, 1, 2, 3, 4]
+
+
+def test_pool_excludes_holdout_and_training_points():
+    cfg = ActiveConfig()
+    rng = np.random.default_rng(0)
+    X_eval = domain_edges(cfg, n_per_side=10)
+    X_train = np.array([[1.0, 2.0]], dtype=np.float32)
+    X_pool = np.vstack([X_eval, X_train, domain_edges(cfg, n_per_side=10, rng=rng)])
+
+    kept = drop_seen(X_pool, X_eval, X_train)
+    assert len(kept) == 40
+    assert not ({tuple(r) for r in kept} & {tuple(r) for r in np.vstack([X_eval, X_train])})
+
+
+def test_drop_seen_treats_signed_zero_as_equal():
+    X = np.array([[-0.0, 10.0], [0.0, 10.0], [5.0, 10.0]], dtype=np.float32)
+    kept = drop_seen(X, np.array([[0.0, 10.0]], dtype=np.float32))
+    assert kept.tolist() == [[5.0, 10.0]]
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import pytest
+from backend.coalesce import SingleFlight
+
+
+def test_identical_keys_share_one_call():
+    calls, fanouts = [], []
+    release = threading.Event()
+    flight = SingleFlight(on_complete=fanouts.append)
+
+    def work(x):
+        calls.append(x)
+        release.wait(5)
+        return x * 2
+
+    async def scenario():
+        tasks = [asyncio.ensure_future(flight.run("k", work, 21)) for _ in range(10)]
+        await asyncio.sleep(0.05)
+        assert len(flight) == 1
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(scenario())
+
+    assert results == [42] * 10
+    assert calls == [21]
+    assert fanouts == [10]
+    assert len(flight) == 0
+
+
+def test_distinct_keys_and_no_caching():
+    calls = []
+    flight = SingleFlight()
+
+    def work(x):
+        calls.append(x)
+        return x
+
+    async def scenario():
+        first = await asyncio.gather(flight.run(1, work, 1), flight.run(2, work, 2))
+        again = await flight.run(1, work, 1)
+        return first, again
+
+    first, again = asyncio.run(scenario())
+
+    assert first == [1, 2]
+    assert again == 1
+    assert sorted(calls) == [1, 1, 2]
+
+
+def test_exception_reaches_every_caller():
+    fanouts = []
+    flight = SingleFlight(on_complete=fanouts.append)
+
+    def boom():
+        raise RuntimeError("bad model")
+
+    async def scenario():
+        return await asyncio.gather(*[flight.run("k", boom) for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(scenario())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert fanouts == [3]
+    assert len(flight) == 0
+
+
+def test_cancelled_caller_does_not_cancel_others():
+    release = threading.Event()
+    flight = SingleFlight()
+
+    def work():
+        release.wait(5)
+        return "ok"
+
+    async def scenario():
+        a = asyncio.ensure_future(flight.run("k", work))
+        b = asyncio.ensure_future(flight.run("k", work))
+        await asyncio.sleep(0.05)
+        a.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await a
+        return await b
+
+    assert asyncio.run(scenario()) == "ok"
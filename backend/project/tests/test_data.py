@@ -72,4 +72,13 @@ def test_load_or_simulate_dataframe_missing():
         df = load_or_simulate_dataframe(path=path)
 
         assert os.path.exists(path)
-        assert len(df) == 2000
\ No newline at end of file
+        assert len(df) == 2000
+
+def test_simulate_projectile_data_custom_range():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "test_data.csv")
+        df = simulate_projectile_data(n=200, path=path, rng_seed=42, v_range=(0, 500), a_range=(0, 90))
+
+        assert (df["velocity"] >= 0).all() and (df["velocity"] <= 500).all()
+        assert (df["angle_deg"] >= 0).all() and (df["angle_deg"] <= 90).all()
+        assert df["velocity"].max() > 100
@@ -0,0 +1,156 @@
+import os
+import tempfile
+import joblib
+import numpy as np
+import pytest
+import torch
+from sklearn.preprocessing import StandardScaler
+from backend.model_def import ProjectileNet
+import training.distill as distill
+from training.distill import DistillConfig, soft_targets, pareto_front, select_student, load_teacher
+
+
+def _row(name, latency, rmse):
+    return {"name": name, "latency_ms_p50": latency, "rmse_overall": rmse}
+
+
+def test_soft_targets_blend():
+    teacher = ProjectileNet()
+    X = np.random.randn(4, 2).astype(np.float32)
+    Y = np.random.randn(4, 3).astype(np.float32)
+
+    with torch.no_grad():
+        t = teacher(torch.tensor(X)).numpy()
+
+    assert np.allclose(soft_targets(teacher, X, Y, 1.0, torch.device("cpu")), t, atol=1e-6)
+    assert np.allclose(soft_targets(teacher, X, Y, 0.0, torch.device("cpu")), Y)
+
+
+def test_pareto_front_flags_dominated_rows():
+    rows = [
+        _row("teacher", 0.05, 1.0),
+        _row("a", 0.02, 3.0),
+        _row("b", 0.03, 4.0),   # slower and worse than "a"
+        _row("c", 0.04, 1.05),
+    ]
+    front = {r["name"]: r["pareto"] for r in pareto_front(rows)}
+    assert front == {"a": True, "b": False, "c": True, "teacher": True}
+
+
+def test_select_student_respects_error_budget():
+    rows = pareto_front([_row("teacher", 0.05, 1.0), _row("a", 0.02, 3.0), _row("c", 0.04, 1.05)])
+    assert select_student(rows, max_rmse=1.1)["name"] == "c"
+    assert select_student(rows, max_rmse=5.0)["name"] == "a"
+    assert select_student(rows, max_rmse=0.5) is None
+
+
+def test_pareto_front_treats_noise_level_latency_as_tie():
+    rows = [
+        _row("teacher", 0.0300, 1.0),
+        dict(_row("student_16", 0.0295, 2.0), latency_ms_noise=0.002),  # faster only by noise
+        _row("student_8", 0.0200, 3.0),
+    ]
+    front = {r["name"]: r["pareto"] for r in pareto_front(rows, rel_tol=0.05)}
+    assert front == {"teacher": True, "student_16": False, "student_8": True}
+
+
+def test_measure_latency_interleaves_models():
+    from training.eval import measure_latency
+    models = {"a": ProjectileNet((8,)), "b": ProjectileNet()}
+    threads = torch.get_num_threads()
+    out = measure_latency(models, torch.device("cpu"), rounds=3, repeats=5, warmup=1)
+
+    assert set(out) == {"a", "b"}
+    assert all(v["latency_ms_p50"] > 0 and v["latency_ms_noise"] >= 0 for v in out.values())
+    assert torch.get_num_threads() == threads
+
+
+def _artifacts(tmpdir, hidden=(64, 32), shift=0.0):
+    paths = {
+        "model_path": os.path.join(tmpdir, "projectile_net.pt"),
+        "scaler_x_path": os.path.join(tmpdir, "projectile_scaler_X.pkl"),
+        "scaler_y_path": os.path.join(tmpdir, "projectile_scaler_y.pkl"),
+    }
+    X = np.array([[10, 10], [100, 80]], dtype=np.float32) + shift
+    Y = np.array([[50, 10, 2], [500, 100, 10]], dtype=np.float32)
+    torch.save(ProjectileNet(hidden).state_dict(), paths["model_path"])
+    joblib.dump(StandardScaler().fit(X), paths["scaler_x_path"])
+    joblib.dump(StandardScaler().fit(Y), paths["scaler_y_path"])
+    return paths
+
+
+def _distill_cfg(tmpdir, **kw):
+    students = os.path.join(tmpdir, "students")
+    return DistillConfig(
+        students_dir=students,
+        teacher_dir=os.path.join(students, "teacher"),
+        export_record_path=os.path.join(students, "exported.json"),
+        domain_data_path=os.path.join(students, "distill_dataset.csv"),
+        pareto_path=os.path.join(tmpdir, "distill_pareto.json"),
+        **kw,
+    )
+
+
+def test_teacher_snapshot_survives_export_and_follows_retraining():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cfg = _distill_cfg(tmpdir, **_artifacts(tmpdir))
+        teacher, sx, _ = load_teacher(cfg, torch.device("cpu"))
+        assert teacher.hidden_sizes == (64, 32)
+
+        # A student exported by this script does not become the next teacher.
+        torch.save(ProjectileNet((8,)).state_dict(), cfg.model_path)
+        os.makedirs(cfg.students_dir, exist_ok=True)
+        with open(cfg.export_record_path, "w") as f:
+            f.write('{"sha256": "%s"}' % distill.file_sha256(cfg.model_path))
+        assert load_teacher(cfg, torch.device("cpu"))[0].hidden_sizes == (64, 32)
+
+        # Retraining rewrites model and scalers together -> the snapshot is refreshed as a unit.
+        _artifacts(tmpdir, hidden=(32,), shift=5.0)
+        teacher, sx2, _ = load_teacher(cfg, torch.device("cpu"))
+        assert teacher.hidden_sizes == (32,)
+        assert not np.allclose(sx.mean_, sx2.mean_)
+
+
+def test_changed_scalers_without_new_model_fail_loudly():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cfg = _distill_cfg(tmpdir, **_artifacts(tmpdir))
+        load_teacher(cfg, torch.device("cpu"))
+
+        joblib.dump(StandardScaler().fit(np.random.rand(10, 2)), cfg.scaler_x_path)
+        with pytest.raises(RuntimeError, match="changed since the teacher snapshot"):
+            load_teacher(cfg, torch.device("cpu"))
+
+
+def test_distill_export_loads_through_get_artifacts(monkeypatch):
+    from project.backend import deps
+
+    def fake_latency(models, *args, **kwargs):
+        # Deterministic: the student is clearly faster than the teacher.
+        return {name: {"latency_ms_p50": 0.01 if name.startswith("student") else 0.05,
+                       "latency_ms_p95": 0.0, "latency_ms_noise": 0.0} for name in models}
+
+    monkeypatch.setattr(distill, "measure_latency", fake_latency)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cfg = _distill_cfg(tmpdir, epochs=2, patience=2, candidates=((8,),), max_rmse_ratio=1e9,
+                           export=True, domain_n=200, **_artifacts(tmpdir))
+        report = distill.main(cfg)
+
+        assert report["chosen"]["name"] == "student_8"
+        assert report["exported"]["sha256"] == distill.file_sha256(cfg.model_path)
+        assert report["budget_domain"]["data_source"] == "domain"
+        assert report["budget_domain"]["velocity"][1] > 100
+
+        monkeypatch.setenv("ARTIFACTS_DIR", tmpdir)
+        deps.get_settings.cache_clear()
+        deps.get_artifacts.cache_clear()
+        try:
+            model, _, _, _ = deps.get_artifacts()
+            assert model.hidden_sizes == (8,)
+        finally:
+            deps.get_settings.cache_clear()
+            deps.get_artifacts.cache_clear()
+
+        # Re-running after the export still distills from the original teacher.
+        rerun = distill.main(cfg)
+        teacher_row = next(r for r in rerun["table"] if r["name"] == "teacher")
+        assert teacher_row["hidden_sizes"] == [64, 32]
@@ -1,8 +1,22 @@
 import torch
-from backend.model_def import ProjectileNet
+from backend.model_def import ProjectileNet, hidden_sizes_from_state_dict
 
 def test_forward_shape():
     model = ProjectileNet()
     x = torch.randn(5, 2)
     y = model(x)
     assert y.shape == (5, 3)
+
+
+def test_custom_hidden_sizes():
+    model = ProjectileNet(hidden_sizes=(16, 8, 4))
+    y = model(torch.randn(5, 2))
+    assert y.shape == (5, 3)
+    assert model.hidden_sizes == (16, 8, 4)
+
+
+def test_hidden_sizes_from_state_dict():
+    for hidden in [(64, 32), (16,), (32, 16, 8)]:
+        state = ProjectileNet(hidden).state_dict()
+        assert hidden_sizes_from_state_dict(state) == hidden
+        ProjectileNet(hidden_sizes_from_state_dict(state)).load_state_dict(state)
@@ -0,0 +1,122 @@
+import threading
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio.to_thread
+import torch
+import torch.nn as nn
+from fastapi.testclient import TestClient
+
+from project.backend.main import app
+from project.backend import deps
+from project.backend.deps import get_loaded_artifacts
+from project.backend.routers import predict as predict_router
+
+
+class _Identity:
+    def transform(self, X):
+        return X
+
+    def inverse_transform(self, X):
+        return X
+
+
+class _BlockingModel(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.release = threading.Event()
+
+    def forward(self, x):
+        self.calls += 1
+        self.release.wait(5)
+        return torch.ones(x.shape[0], 3)
+
+
+def _metric(text, name):
+    for line in text.splitlines():
+        if line.startswith(name + " "):
+            return float(line.split()[-1])
+    return 0.0
+
+
+def test_normalize_merges_equivalent_inputs():
+    assert predict_router._normalize(-0.0, 45.0) == predict_router._normalize(0.0, 45.0)
+    assert predict_router._normalize(50, 45) == predict_router._normalize(50.0, 45.0)
+    assert predict_router._normalize(50.0, 45.0) == predict_router._normalize(50.0 + 1e-9, 45.0)
+    assert predict_router._normalize(50.0, 45.0) != predict_router._normalize(50.1, 45.0)
+
+
+def test_identical_requests_share_one_forward_pass():
+    n = 6
+    model = _BlockingModel()
+    app.dependency_overrides[get_loaded_artifacts] = lambda: (model, _Identity(), _Identity(), torch.device("cpu"))
+    try:
+        with TestClient(app) as client:
+            before = client.get("/metrics").text
+            with ThreadPoolExecutor(max_workers=n) as pool:
+                futures = [pool.submit(client.post, "/predict", json={"velocity": 50, "angle_deg": 45}) for _ in range(n)]
+
+                deadline = time.time() + 5
+                while predict_router._flight._callers.get((50.0, 45.0), 0) < n and time.time() < deadline:
+                    time.sleep(0.01)
+                model.release.set()
+                responses = [f.result() for f in futures]
+            after = client.get("/metrics").text
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [r.status_code for r in responses] == [200] * n
+    assert responses[0].json()["prediction"] == {"range_m": 1.0, "max_height_m": 1.0, "flight_time_s": 1.0}
+    assert model.calls == 1
+    assert _metric(after, "predict_coalesced_total") - _metric(before, "predict_coalesced_total") == n - 1
+    assert _metric(after, "predict_singleflight_fanout_count") - _metric(before, "predict_singleflight_fanout_count") == 1
+    assert _metric(after, "predict_singleflight_fanout_sum") - _metric(before, "predict_singleflight_fanout_sum") == n
+    assert len(predict_router._flight) == 0
+
+
+def test_missing_artifacts_are_not_reported_as_inference_failure():
+    def broken():
+        raise FileNotFoundError("/secret/path/projectile_net.pt")
+
+    app.dependency_overrides[get_loaded_artifacts] = broken
+    try:
+        with TestClient(app, raise_server_exceptions=False) as client:
+            resp = client.post("/predict", json={"velocity": 50, "angle_deg": 45})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert resp.status_code == 500
+    assert "/secret/path" not in resp.text
+
+
+def test_duplicates_do_not_each_take_a_threadpool_hop(monkeypatch):
+    n = 6
+    model = _BlockingModel()
+    cached = functools.lru_cache(lambda: (model, _Identity(), _Identity(), torch.device("cpu")))
+    cached()  # artifacts already loaded, as after the first request
+    monkeypatch.setattr(deps, "get_artifacts", cached)
+
+    hops = []
+    real_run_sync = anyio.to_thread.run_sync
+
+    async def counting_run_sync(func, *args, **kwargs):
+        hops.append(getattr(func, "__name__", repr(func)))
+        return await real_run_sync(func, *args, **kwargs)
+
+    monkeypatch.setattr(anyio.to_thread, "run_sync", counting_run_sync)
+
+    with TestClient(app) as client:
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            futures = [pool.submit(client.post, "/predict", json={"velocity": 12, "angle_deg": 34}) for _ in range(n)]
+
+            deadline = time.time() + 5
+            while predict_router._flight._callers.get((12.0, 34.0), 0) < n and time.time() < deadline:
+                time.sleep(0.01)
+            model.release.set()
+            responses = [f.result() for f in futures]
+
+    assert [r.status_code for r in responses] == [200] * n
+    assert model.calls == 1
+    assert len(hops) == 1  # the single shared forward pass
@@ -0,0 +1,189 @@
+import os
+import json
+import time
+import logging
+from dataclasses import dataclass, asdict, replace
+
+import joblib
+import numpy as np
+import pandas as pd
+import torch
+from torch.utils.data import TensorDataset, DataLoader
+from sklearn.preprocessing import StandardScaler
+
+from backend.model_def import ProjectileNet
+from training.data import projectile_targets
+from training.eval import evaluate
+from training.train import Config, set_seed, train_model
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ActiveConfig(Config):
+    # Sampling domain matches the API's PredictRequest bounds.
+    v_range: tuple = (0.0, 500.0)
+    a_range: tuple = (0.0, 90.0)
+
+    initial_n: int = 500
+    val_n: int = 2000
+    eval_n: int = 20000          # fixed holdout the stopping criterion is checked on
+    pool_n: int = 20000          # fresh candidate pool drawn every round
+    add_per_round: int = 250
+    explore_frac: float = 0.2    # share of each round's additions drawn uniformly
+    max_rounds: int = 30
+    round_epochs: int = 150
+    round_patience: int = 20
+    target_max_error: float = 0.035  # max |error| in target standard deviations
+
+    active_data_path: str = "./artifacts/projectile_dataset_active.csv"
+    active_metrics_path: str = "./artifacts/projectile_active_metrics.json"
+
+
+def sample_domain(rng, n, cfg: ActiveConfig):
+    v = rng.uniform(*cfg.v_range, n)
+    a = rng.uniform(*cfg.a_range, n)
+    return np.stack([v, a], axis=1).astype(np.float32)
+
+
+def domain_edges(cfg: ActiveConfig, n_per_side=50, rng=None):
+    # Uniform draws rarely land on the boundary, which is exactly where the old model was weakest.
+    # With `rng` the points are drawn at random along each side instead of on a fixed grid.
+    if rng is None:
+        v = np.linspace(*cfg.v_range, n_per_side)
+        a = np.linspace(*cfg.a_range, n_per_side)
+    else:
+        v = rng.uniform(*cfg.v_range, n_per_side)
+        a = rng.uniform(*cfg.a_range, n_per_side)
+    edges = [
+        np.stack([v, np.full_like(v, cfg.a_range[0])], 1), np.stack([v, np.full_like(v, cfg.a_range[1])], 1),
+        np.stack([np.full_like(a, cfg.v_range[0]), a], 1), np.stack([np.full_like(a, cfg.v_range[1]), a], 1),
+    ]
+    return np.vstack(edges).astype(np.float32)
+
+
+def targets(X):
+    return np.stack(projectile_targets(X[:, 0].astype(np.float64), X[:, 1].astype(np.float64)), axis=1).astype(np.float32)
+
+
+def scaled_errors(model, X, Y, sx, sy, device):
+    """Per-sample max absolute error over outputs, in target standard deviations."""
+    model.eval()
+    with torch.no_grad():
+        Xs = torch.tensor(sx.transform(X).astype(np.float32), device=device)
+        pred_s = model(Xs).cpu().numpy()
+    return np.abs(pred_s - sy.transform(Y)).max(axis=1)
+
+
+def _row_keys(X):
+    # Each (velocity, angle) float32 pair reinterpreted as one uint64; +0.0 folds -0.0 into 0.0.
+    return np.ascontiguousarray(X.astype(np.float32) + np.float32(0.0)).view(np.uint64).ravel()
+
+
+def drop_seen(X, *seen):
+    """Rows of `X` that appear in none of the `seen` arrays (exact float32 match)."""
+    keep = ~np.isin(_row_keys(X), np.concatenate([_row_keys(S) for S in seen]))
+    return X[keep]
+
+
+def select_samples(rng, errors, n_add, explore_frac):
+    n_add = min(n_add, len(errors))
+    n_explore = int(round(n_add * explore_frac))
+    n_worst = n_add - n_explore
+    worst = np.argpartition(-errors, min(n_worst, len(errors) - 1))[:n_worst]
+    rest = np.setdiff1d(np.arange(len(errors)), worst)
+    explore = rng.choice(rest, size=n_explore, replace=False)
+    return np.concatenate([worst, explore])
+
+
+def _loader(X, Y, sx, sy, cfg, shuffle):
+    ds = TensorDataset(
+        torch.tensor(sx.transform(X).astype(np.float32)),
+        torch.tensor(sy.transform(Y).astype(np.float32)),
+    )
+    return DataLoader(ds, batch_size=cfg.batch_size, shuffle=shuffle, num_workers=cfg.num_workers)
+
+
+def main(cfg: ActiveConfig):
+    set_seed(cfg.seed)
+    rng = np.random.default_rng(cfg.seed)
+
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    logger.info(f"Using device: {device}")
+
+    X_eval = np.vstack([sample_domain(rng, cfg.eval_n, cfg), domain_edges(cfg)])
+    Y_eval = targets(X_eval)
+    X_val = sample_domain(rng, cfg.val_n, cfg)
+    Y_val = targets(X_val)
+
+    # Scalers are fit once on the whole domain so warm-started weights stay valid across rounds.
+    sx = StandardScaler().fit(X_eval)
+    sy = StandardScaler().fit(Y_eval)
+    os.makedirs(os.path.dirname(cfg.scaler_x_path), exist_ok=True)
+    joblib.dump(sx, cfg.scaler_x_path)
+    joblib.dump(sy, cfg.scaler_y_path)
+
+    X_train = sample_domain(rng, cfg.initial_n, cfg)
+    val_loader = _loader(X_val, Y_val, sx, sy, cfg, shuffle=False)
+    round_cfg = replace(cfg, epochs=cfg.round_epochs, patience=cfg.round_patience)
+
+    model = ProjectileNet().to(device)
+    rounds = []
+    start = time.perf_counter()
+    for rnd in range(1, cfg.max_rounds + 1):
+        loaders = {"train": _loader(X_train, targets(X_train), sx, sy, cfg, shuffle=True), "val": val_loader}
+        _, best_epoch, best_val = train_model(model, loaders, round_cfg, device)  # warm start: same model object
+
+        max_err = float(scaled_errors(model, X_eval, Y_eval, sx, sy, device).max())
+        rounds.append({
+            "round": rnd,
+            "n_samples": len(X_train),
+            "best_epoch": best_epoch,
+            "best_val_loss_scaled": best_val,
+            "max_error_scaled": max_err,
+            "elapsed_s": time.perf_counter() - start,
+        })
+        logger.info(f"Round {rnd:3d} - samples={len(X_train)} max_err={max_err:.4f} (target {cfg.target_max_error})")
+        if max_err <= cfg.target_max_error or rnd == cfg.max_rounds:
+            break
+
+        # Fresh random edge points, minus anything already trained on or used by the stop check.
+        X_pool = np.vstack([sample_domain(rng, cfg.pool_n, cfg), domain_edges(cfg, rng=rng)])
+        X_pool = drop_seen(X_pool, X_eval, X_train)
+        pool_err = scaled_errors(model, X_pool, targets(X_pool), sx, sy, device)
+        X_train = np.vstack([X_train, X_pool[select_samples(rng, pool_err, cfg.add_per_round, cfg.explore_frac)]])
+
+    metrics = evaluate(model, _loader(X_eval, Y_eval, sx, sy, cfg, shuffle=False), sy, device)
+    reached = rounds[-1]["max_error_scaled"] <= cfg.target_max_error
+
+    Y_train = targets(X_train)
+    os.makedirs(os.path.dirname(cfg.active_data_path), exist_ok=True)
+    pd.DataFrame({
+        "velocity": X_train[:, 0],
+        "angle_deg": X_train[:, 1],
+        "range": Y_train[:, 0],
+        "max_height": Y_train[:, 1],
+        "flight_time": Y_train[:, 2],
+    }).to_csv(cfg.active_data_path, index=False)
+
+    meta = {
+        "config": asdict(cfg),
+        "device": str(device),
+        "target_reached": reached,
+        "rounds": rounds,
+        "eval_metrics": metrics,
+    }
+    os.makedirs(os.path.dirname(cfg.active_metrics_path), exist_ok=True)
+    with open(cfg.active_metrics_path, "w") as f:
+        json.dump(meta, f, indent=2)
+
+    logger.info(f"Active training {'reached' if reached else 'did not reach'} target after {len(rounds)} rounds, "
+                f"{len(X_train)} samples, {rounds[-1]['elapsed_s']:.1f}s")
+    logger.info(f"  Model: {cfg.model_path}")
+    logger.info(f"  Data: {cfg.active_data_path}")
+    logger.info(f"  Metrics: {cfg.active_metrics_path}")
+    return meta
+
+
+if __name__ == "__main__":
+    main(ActiveConfig())
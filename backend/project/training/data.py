@@ -3,15 +3,24 @@ import numpy as np
 import pandas as pd
 
 
-def simulate_projectile_data(n=2000, path="project/artifacts/projectile_dataset.csv", rng_seed=42):
-    np.random.seed(rng_seed)
-    v = np.random.uniform(10, 100, n)
-    a = np.random.uniform(10, 80, n)
-    g = 9.81
+G = 9.81
+
+
+def projectile_targets(v, a):
+    """Vectorized analytic (range, max_height, flight_time) for velocities `v` and angles `a` (deg)."""
     theta = np.radians(a)
-    t = 2 * v * np.sin(theta) / g
-    h = (v**2) * (np.sin(theta)**2) / (2 * g)
-    r = (v**2) * np.sin(2 * theta) / g
+    t = 2 * v * np.sin(theta) / G
+    h = (v**2) * (np.sin(theta)**2) / (2 * G)
+    r = (v**2) * np.sin(2 * theta) / G
+    return r, h, t
+
+
+def simulate_projectile_data(n=2000, path="project/artifacts/projectile_dataset.csv", rng_seed=42,
+                             v_range=(10, 100), a_range=(10, 80)):
+    np.random.seed(rng_seed)
+    v = np.random.uniform(*v_range, n)
+    a = np.random.uniform(*a_range, n)
+    r, h, t = projectile_targets(v, a)
 
     df = pd.DataFrame({
         "velocity": v,
@@ -0,0 +1,262 @@
+import os
+import copy
+import json
+import shutil
+import hashlib
+import logging
+import argparse
+from dataclasses import dataclass, asdict, replace
+
+import joblib
+import numpy as np
+import pandas as pd
+import torch
+
+from backend.model_def import ProjectileNet, hidden_sizes_from_state_dict
+from training.data import load_or_simulate_dataframe, simulate_projectile_data
+from training.prep import split_and_scale, make_loaders
+from training.eval import evaluate, measure_latency
+from training.train import Config, set_seed, train_model
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DistillConfig(Config):
+    candidates: tuple = ((64, 32), (32, 16), (16, 16), (16, 8), (32,), (16,), (8,))
+    alpha: float = 0.5            # weight on teacher outputs vs. analytic targets
+    max_rmse_ratio: float = 1.10  # a student may be at most 10% worse than the teacher
+    latency_batch_size: int = 1   # /predict serves one input per request
+    latency_rounds: int = 15
+    latency_repeats: int = 50
+    latency_threads: int = 1
+    latency_rel_tol: float = 0.05 # latencies closer than this (or the measured noise) count as tied
+    export: bool = False
+
+    # Where students are trained and scored: "domain" draws fresh samples over the API bounds,
+    # "dataset" uses data_path, "active" uses the set written by training.active.
+    data_source: str = "domain"
+    v_range: tuple = (0.0, 500.0)
+    a_range: tuple = (0.0, 90.0)
+    domain_n: int = 5000
+    domain_data_path: str = "./artifacts/students/distill_dataset.csv"
+    active_data_path: str = "./artifacts/projectile_dataset_active.csv"
+
+    students_dir: str = "./artifacts/students"
+    # Teacher weights + scalers are snapshotted as a unit. An exported student at model_path
+    # (recognised by export_record_path) never becomes the next run's teacher.
+    teacher_dir: str = "./artifacts/students/teacher"
+    export_record_path: str = "./artifacts/students/exported.json"
+    pareto_path: str = "./artifacts/distill_pareto.json"
+
+
+def soft_targets(teacher, X_s, Y_s, alpha, device):
+    # alpha*|s-t|^2 + (1-alpha)*|s-y|^2 equals |s - (alpha*t + (1-alpha)*y)|^2 up to a constant,
+    # so the blended targets let train_model() be reused unchanged.
+    teacher.eval()
+    with torch.no_grad():
+        t = teacher(torch.tensor(X_s, device=device)).cpu().numpy()
+    return (alpha * t + (1 - alpha) * Y_s).astype(np.float32)
+
+
+def _dominates(a, b, x, y, noise, rel_tol):
+    tol = max(a.get(noise, 0.0), b.get(noise, 0.0), rel_tol * min(a[x], b[x]))
+    no_worse = a[y] <= b[y] and a[x] <= b[x] + tol
+    better = a[y] < b[y] or a[x] < b[x] - tol
+    return no_worse and better
+
+
+def pareto_front(rows, x="latency_ms_p50", y="rmse_overall", noise="latency_ms_noise", rel_tol=0.05):
+    # Latencies within measurement noise are tied, so among those only error decides.
+    return [
+        dict(row, pareto=not any(_dominates(o, row, x, y, noise, rel_tol) for o in rows if o is not row))
+        for row in sorted(rows, key=lambda r: (r[x], r[y]))
+    ]
+
+
+def select_student(rows, max_rmse):
+    ok = [r for r in rows if r["pareto"] and r["rmse_overall"] <= max_rmse]
+    return min(ok, key=lambda r: r["latency_ms_p50"]) if ok else None
+
+
+def profile(name, model, path, loaders, sy, device):
+    metrics = evaluate(model, loaders["test"], sy, device)
+    return {
+        "name": name,
+        "hidden_sizes": list(model.hidden_sizes),
+        "params": sum(p.numel() for p in model.parameters()),
+        "rmse_overall": metrics["rmse_overall"],
+        "mae_overall": metrics["mae_overall"],
+        "path": path,
+    }
+
+
+def file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def teacher_files(cfg: DistillConfig):
+    return {
+        os.path.join(cfg.teacher_dir, os.path.basename(src)): src
+        for src in (cfg.model_path, cfg.scaler_x_path, cfg.scaler_y_path)
+    }
+
+
+def _exported_sha256(cfg: DistillConfig):
+    if not os.path.exists(cfg.export_record_path):
+        return None
+    with open(cfg.export_record_path) as f:
+        return json.load(f).get("sha256")
+
+
+def snapshot_teacher(cfg: DistillConfig):
+    """Make teacher_dir hold the model and scalers that belong together.
+
+    The snapshot is refreshed when model_path holds a new model, i.e. neither the snapshot
+    nor a student this script exported. Raises if the live scalers changed but the model did not,
+    since the served model would then be paired with scalers it was not trained on.
+    """
+    files = teacher_files(cfg)
+    snap_model = os.path.join(cfg.teacher_dir, os.path.basename(cfg.model_path))
+    live = file_sha256(cfg.model_path)
+    known = {_exported_sha256(cfg)}
+    if os.path.exists(snap_model):
+        known.add(file_sha256(snap_model))
+
+    if live not in known:
+        os.makedirs(cfg.teacher_dir, exist_ok=True)
+        for dst, src in files.items():
+            shutil.copyfile(src, dst)
+        logger.info(f"Snapshotted teacher {cfg.model_path} (+ scalers) -> {cfg.teacher_dir}")
+
+    for dst, src in files.items():
+        if src != cfg.model_path and file_sha256(dst) != file_sha256(src):
+            raise RuntimeError(
+                f"{src} changed since the teacher snapshot in {cfg.teacher_dir} but {cfg.model_path} did not; "
+                f"retrain (training.train / training.active) so model and scalers match again."
+            )
+
+
+def load_teacher(cfg: DistillConfig, device):
+    snapshot_teacher(cfg)
+    snap = {os.path.basename(src): dst for dst, src in teacher_files(cfg).items()}
+    sx = joblib.load(snap[os.path.basename(cfg.scaler_x_path)])
+    sy = joblib.load(snap[os.path.basename(cfg.scaler_y_path)])
+    state = torch.load(snap[os.path.basename(cfg.model_path)], map_location=device)
+    teacher = ProjectileNet(hidden_sizes_from_state_dict(state)).to(device)
+    teacher.load_state_dict(state)
+    return teacher.eval(), sx, sy
+
+
+def load_distill_data(cfg: DistillConfig):
+    if cfg.data_source == "domain":
+        return simulate_projectile_data(n=cfg.domain_n, path=cfg.domain_data_path, rng_seed=cfg.seed,
+                                        v_range=cfg.v_range, a_range=cfg.a_range)
+    if cfg.data_source == "active":
+        return pd.read_csv(cfg.active_data_path)
+    if cfg.data_source == "dataset":
+        return load_or_simulate_dataframe(cfg.data_path)
+    raise ValueError(f"Unknown data_source: {cfg.data_source}")
+
+
+def log_table(rows, chosen):
+    logger.info(f"{'name':<12} {'hidden':<10} {'params':>7} {'rmse':>10} {'p50 ms':>8} {'noise ms':>8}  pareto")
+    for r in rows:
+        mark = " <- chosen" if chosen is not None and r["name"] == chosen["name"] else ""
+        hidden = "x".join(map(str, r["hidden_sizes"]))
+        logger.info(
+            f"{r['name']:<12} {hidden:<10} {r['params']:>7d} {r['rmse_overall']:>10.4f} "
+            f"{r['latency_ms_p50']:>8.4f} {r['latency_ms_noise']:>8.4f}  {'yes' if r['pareto'] else 'no '}{mark}"
+        )
+
+
+def main(cfg: DistillConfig):
+    set_seed(cfg.seed)
+
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    logger.info(f"Using device: {device}")
+
+    teacher, sx, sy = load_teacher(cfg, device)
+    os.makedirs(cfg.students_dir, exist_ok=True)
+
+    df = load_distill_data(cfg)
+    domain = {
+        "data_source": cfg.data_source,
+        "n_rows": len(df),
+        "velocity": [float(df["velocity"].min()), float(df["velocity"].max())],
+        "angle_deg": [float(df["angle_deg"].min()), float(df["angle_deg"].max())],
+    }
+    logger.info(f"Distilling on {domain}")
+
+    splits, _ = split_and_scale(df, cfg, scalers=(sx, sy))
+    X_train_s, Y_train_s, X_val_s, Y_val_s, X_test_s, Y_test_s = splits
+    soft = (
+        X_train_s, soft_targets(teacher, X_train_s, Y_train_s, cfg.alpha, device),
+        X_val_s, soft_targets(teacher, X_val_s, Y_val_s, cfg.alpha, device),
+        X_test_s, Y_test_s,  # test stays on analytic targets
+    )
+    loaders = make_loaders(soft, cfg)
+
+    teacher_model_path = os.path.join(cfg.teacher_dir, os.path.basename(cfg.model_path))
+    rows = [profile("teacher", teacher, teacher_model_path, loaders, sy, device)]
+    cpu_models = {"teacher": copy.deepcopy(teacher).cpu()}
+    for hidden in cfg.candidates:
+        tag = "x".join(map(str, hidden))
+        path = os.path.join(cfg.students_dir, f"projectile_net_{tag}.pt")
+        logger.info(f"Distilling student {tag}")
+
+        set_seed(cfg.seed)
+        student = ProjectileNet(hidden).to(device)
+        train_model(student, loaders, replace(cfg, model_path=path), device)
+        rows.append(profile(f"student_{tag}", student, path, loaders, sy, device))
+        cpu_models[f"student_{tag}"] = copy.deepcopy(student).cpu()
+
+    latency = measure_latency(
+        cpu_models, torch.device("cpu"), batch_size=cfg.latency_batch_size, rounds=cfg.latency_rounds,
+        repeats=cfg.latency_repeats, num_threads=cfg.latency_threads, seed=cfg.seed,
+    )
+    rows = [dict(r, **latency[r["name"]]) for r in rows]
+
+    rows = pareto_front(rows, rel_tol=cfg.latency_rel_tol)
+    teacher_rmse = next(r["rmse_overall"] for r in rows if r["name"] == "teacher")
+    max_rmse = teacher_rmse * cfg.max_rmse_ratio
+    chosen = select_student(rows, max_rmse)
+    log_table(rows, chosen)
+
+    report = {
+        "config": asdict(cfg),
+        "device": str(device),
+        "budget_domain": domain,
+        "max_rmse": max_rmse,
+        "chosen": chosen,
+        "exported": None,
+        "table": rows,
+    }
+
+    if chosen is None or chosen["name"] == "teacher":
+        logger.info("No student is measurably faster than the teacher within the error budget; nothing to export.")
+    elif cfg.export:
+        shutil.copyfile(chosen["path"], cfg.model_path)
+        report["exported"] = {"name": chosen["name"], "path": cfg.model_path, "sha256": file_sha256(cfg.model_path)}
+        with open(cfg.export_record_path, "w") as f:
+            json.dump(report["exported"], f, indent=2)
+        logger.info(f"Exported {chosen['name']} to {cfg.model_path} (teacher kept in {cfg.teacher_dir})")
+    else:
+        logger.info(f"Chosen {chosen['name']}; re-run with --export to write it to {cfg.model_path}")
+
+    os.makedirs(os.path.dirname(cfg.pareto_path), exist_ok=True)
+    with open(cfg.pareto_path, "w") as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"Pareto table: {cfg.pareto_path}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Distill smaller ProjectileNet students and size-search by latency.")
+    parser.add_argument("--export", action="store_true", help="overwrite model_path with the chosen student")
+    parser.add_argument("--alpha", type=float, default=DistillConfig.alpha)
+    parser.add_argument("--data", choices=["domain", "dataset", "active"], default=DistillConfig.data_source,
+                        help="samples the students are trained and scored on")
+    args = parser.parse_args()
+    main(DistillConfig(export=args.export, alpha=args.alpha, data_source=args.data))
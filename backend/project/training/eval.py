@@ -1,4 +1,6 @@
 import json
+import time
+import random
 import numpy as np
 import matplotlib
 matplotlib.use("Agg")
@@ -53,6 +55,48 @@ def evaluate(model, loader, sy, device):
         return metrics
 
 
+def measure_latency(models, device, batch_size=1, rounds=15, repeats=50, warmup=20, num_threads=1, seed=0):
+    """Per-call forward latency (ms) for each model in `models` (name -> module).
+
+    Models are timed in a shuffled, interleaved order over several rounds with a fixed thread count,
+    so drift and background load hit every candidate alike. `latency_ms_noise` is the IQR across rounds.
+    """
+    prev_threads = torch.get_num_threads()
+    torch.set_num_threads(num_threads)
+    x = torch.randn(batch_size, 2, device=device)
+    per_round = {name: [] for name in models}
+    order = list(models)
+    rng = random.Random(seed)
+    try:
+        with torch.no_grad():
+            for model in models.values():
+                model.eval()
+                for _ in range(warmup):
+                    model(x)
+            for _ in range(rounds):
+                rng.shuffle(order)
+                for name in order:
+                    model = models[name]
+                    start = time.perf_counter()
+                    for _ in range(repeats):
+                        model(x)
+                    if device.type == "cuda":
+                        torch.cuda.synchronize()
+                    per_round[name].append((time.perf_counter() - start) * 1e3 / repeats)
+    finally:
+        torch.set_num_threads(prev_threads)
+
+    out = {}
+    for name, t in per_round.items():
+        q25, q50, q75, q95 = np.percentile(t, [25, 50, 75, 95])
+        out[name] = {
+            "latency_ms_p50": float(q50),
+            "latency_ms_p95": float(q95),
+            "latency_ms_noise": float(q75 - q25),
+        }
+    return out
+
+
 def plot_history(history, path):
     plt.figure(figsize=(8, 5))
     plt.plot(history["train_loss"], label="Train")
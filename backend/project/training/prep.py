@@ -6,7 +6,7 @@ from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 
 
-def split_and_scale(df, cfg):
+def split_and_scale(df, cfg, scalers=None):
     X = df[["velocity", "angle_deg"]].values.astype(np.float32)
     Y = df[["range", "max_height", "flight_time"]].values.astype(np.float32)
 
@@ -17,8 +17,12 @@ def split_and_scale(df, cfg):
     X_train, Y_train, test_size=cfg.val_size, random_state=cfg.seed
     )
 
-    sx = StandardScaler().fit(X_train)
-    sy = StandardScaler().fit(Y_train)
+    # Reusing existing scalers keeps a distilled student servable with the teacher's artifacts.
+    if scalers is None:
+        sx = StandardScaler().fit(X_train)
+        sy = StandardScaler().fit(Y_train)
+    else:
+        sx, sy = scalers
 
     X_train_s = sx.transform(X_train).astype(np.float32)
     X_val_s = sx.transform(X_val).astype(np.float32)
@@ -28,8 +32,9 @@ def split_and_scale(df, cfg):
     Y_val_s = sy.transform(Y_val).astype(np.float32)
     Y_test_s = sy.transform(Y_test).astype(np.float32)
 
-    joblib.dump(sx, cfg.scaler_x_path)
-    joblib.dump(sy, cfg.scaler_y_path)
+    if scalers is None:
+        joblib.dump(sx, cfg.scaler_x_path)
+        joblib.dump(sy, cfg.scaler_y_path)
 
     return (X_train_s, Y_train_s, X_val_s, Y_val_s, X_test_s, Y_test_s), (sx, sy)
 